@@ -22,7 +22,9 @@ The soil_water.py module contains the following:
 """
 
 import pandas as pd
+import numpy as np
 import datetime
+import os
 
 class SoilWaterSeries:
     """A class for managing a series of measured soil water content data
@@ -39,6 +41,11 @@ class SoilWaterSeries:
         User-defined file descriptions or metadata (default = '')
     tmstmp : datetime
         Time stamp for the class
+    swpcols : list
+        SoilWaterProfile root zone attributes stored per profile in
+        binary files, along with Year-DOY, Depth, and SWC columns
+    binfmts : list
+        Supported binary file formats
     swdata : dict
         Container for SoilWaterProfile objects
         key - measurement date as string ('yyyy-ddd')
@@ -50,15 +57,29 @@ class SoilWaterSeries:
         Save soil water series data to a file
     loadfile(filepath='pyfao56.sws')
         Load soil water series data from a file
+    savebinary(filepath='pyfao56.swb',fmt='feather')
+        Save soil water series data to a binary file
+    loadbinary(filepath='pyfao56.swb',fmt='feather')
+        Load soil water series data from a binary file
     addprofile(mdate,swp)
         Add a SoilWaterProfile object to self.swdata
     customload()
         Override this function to customize loading measured volumetric
         soil water content data.
+    getZr(mdl)
+        Get Zr for all profiles from model simulation output
+    computeDr(negdep=True)
+        Compute root zone soil water status metrics for all profiles
+    computeKs(mdl)
+        Estimate Ks for all profiles from measured Dr, TAW, and RAW
     summarize()
         Summarize the series of root zone soil water metrics
     """
 
+    swpcols = ['Zr','mDr','mDrmax','mfDr','mfDrmax','mSWCr',
+               'mSWCrmax','mKs']
+    binfmts = ['feather','parquet','hdf']
+
     def __init__(self,filepath=None,par=None,sol=None,comment=''):
         """Initialize the SoilWaterSeries class attributes.
 
@@ -102,17 +123,17 @@ class SoilWaterSeries:
            '{:s}\n'
           ).format(ast,timestamp,ast,self.comment,ast)
         if len(self.swdata) > 0:
-            s += 'Year-DOY  n'
-            key0 = list(self.swdata.keys())[0]
+            key0 = next(iter(self.swdata))
             n = len(self.swdata[key0].mvswc)
-            for i in range(n):
-                s += ' D{:02d}'.format(i+1)
-            for i in range(n):
-                s += ' SWC{:02d}'.format(i+1)
-            s += '    Zr      mDr   mDrmax   mfDr mfDrmax mSWCr mSWCrmax'
-            s += '    mKs\n'
-            for key in sorted(self.swdata.keys()):
-                s += self.swdata[key].__str__() + '\n'
+            hdr = ['Year-DOY  n']
+            hdr += [' D{:02d}'.format(i+1) for i in range(n)]
+            hdr += [' SWC{:02d}'.format(i+1) for i in range(n)]
+            hdr += ['    Zr      mDr   mDrmax   mfDr mfDrmax mSWCr'
+                    ' mSWCrmax    mKs']
+            lines = [''.join(hdr)]
+            lines += [self.swdata[key].__str__()
+                      for key in sorted(self.swdata.keys())]
+            s += '\n'.join(lines) + '\n'
         return s
 
     def savefile(self,filepath='pyfao56.sws'):
@@ -145,12 +166,10 @@ class SoilWaterSeries:
         """
 
         try:
-            f = open(filepath, 'w')
+            with open(filepath, 'w') as f:
+                f.write(self.__str__())
         except FileNotFoundError:
             print('The filepath for soil water data is not found.')
-        else:
-            f.write(self.__str__())
-            f.close()
 
     def loadfile(self, filepath='pyfao56.sws'):
         """Load measured soil water content data from a file
@@ -176,19 +195,18 @@ class SoilWaterSeries:
         """
 
         try:
-            f = open(filepath, 'r')
+            with open(filepath, 'r') as f:
+                lines = f.read().splitlines()
         except FileNotFoundError:
             print('The filepath for soil water data is not found.')
         else:
-            lines = f.readlines()
-            f.close()
             ast = '*' * 72
             a = [i for i,line in enumerate(lines) if line.strip()==ast]
             endast = a[-1]
             if endast == 3: #v1.1.0 and prior - no timestamps & metadata
                 self.comment = 'Comments: '
             else:
-                self.comment = ''.join(lines[5:endast]).strip()
+                self.comment = '\n'.join(lines[5:endast]).strip()
             if endast >= 4:
                 ts = lines[3].strip().split('stamp:')[1].strip()
                 ts = datetime.datetime.strptime(ts,'%m/%d/%Y %H:%M:%S')
@@ -198,11 +216,9 @@ class SoilWaterSeries:
                 line = line.strip().split()
                 mdate = line[0]
                 numdpths = int(line[1])
-                mvswc = dict()
-                for i in list(range(numdpths)):
-                    dpth = int(line[2+i])
-                    swc = float(line[2+i+numdpths])
-                    mvswc.update({dpth:swc})
+                dpths = map(int, line[2:2+numdpths])
+                swcs = map(float, line[2+numdpths:2+numdpths*2])
+                mvswc = dict(zip(dpths, swcs))
                 try:
                     Zr = float(line[2+numdpths*2+1])
                 except:
@@ -214,6 +230,142 @@ class SoilWaterSeries:
                                             Zr = Zr)
                 self.addprofile(mdate,swp)
 
+    def savebinary(self,filepath='pyfao56.swb',fmt='feather'):
+        """Save pyfao56 soil water series data to a binary file.
+
+        The file contains one row for each SWC measurement layer with
+        the following columns:
+        Year-DOY - SWC measurement date as string ('yyyy-ddd')
+        Depth    - Bottom depth of SWC measurement layer (cm)
+        SWC      - Measured volumetric SWC (cm3/cm3)
+        Zr, mDr, mDrmax, mfDr, mfDrmax, mSWCr, mSWCrmax, mKs - Root
+            zone values of the profile, repeated for each layer
+        The comment and the time stamp of the save are stored as file
+        metadata. Unlike savefile, values are stored as float64
+        without text formatting, so loadbinary restores the computed
+        metrics exactly and without parsing. Use savefile for
+        human-readable output. The 'feather' and 'parquet' formats
+        require the pyarrow package, and the 'hdf' format requires the
+        tables package. If the directory of filepath is not found, a
+        message is printed and no file is saved.
+
+        Parameters
+        ----------
+        filepath : str, optional
+            Any valid filepath string (default = 'pyfao56.swb')
+        fmt : str, optional
+            Binary file format, 'feather', 'parquet', or 'hdf'
+            (default = 'feather')
+
+        Raises
+        ------
+        ValueError
+            If fmt is not one of self.binfmts.
+        """
+
+        if fmt not in self.binfmts:
+            raise ValueError('Unknown binary file format: ' + str(fmt))
+        dirpath = os.path.dirname(os.path.abspath(filepath))
+        if not os.path.isdir(dirpath):
+            print('The filepath for soil water data is not found.')
+            return
+        self.tmstmp = datetime.datetime.now()
+        meta = {'comment':self.comment,
+                'tmstmp':self.tmstmp.strftime('%m/%d/%Y %H:%M:%S')}
+        df = self._todataframe()
+        if fmt == 'hdf':
+            with pd.HDFStore(filepath, mode='w', complib='blosc:zstd',
+                             complevel=3) as store:
+                store.put('swdata', df, format='fixed')
+                store.get_storer('swdata').attrs.pyfao56 = meta
+        else:
+            df.attrs = meta
+            if fmt == 'parquet':
+                df.to_parquet(filepath, compression='zstd', index=False)
+            else:
+                df.to_feather(filepath)
+
+    def loadbinary(self,filepath='pyfao56.swb',fmt='feather'):
+        """Load soil water series data from a binary file.
+
+        The function expects a file saved by savebinary. If filepath
+        is not found, a message is printed and self.swdata is unchanged.
+
+        Parameters
+        ----------
+        filepath : str, optional
+            Any valid filepath string (default = 'pyfao56.swb')
+        fmt : str, optional
+            Binary file format, 'feather', 'parquet', or 'hdf'
+            (default = 'feather')
+
+        Raises
+        ------
+        ValueError
+            If fmt is not one of self.binfmts.
+        """
+
+        if fmt not in self.binfmts:
+            raise ValueError('Unknown binary file format: ' + str(fmt))
+        try:
+            if fmt == 'hdf':
+                with pd.HDFStore(filepath, mode='r') as store:
+                    df = store.get('swdata')
+                    meta = store.get_storer('swdata').attrs.pyfao56
+            else:
+                if fmt == 'parquet':
+                    df = pd.read_parquet(filepath)
+                else:
+                    df = pd.read_feather(filepath)
+                meta = df.attrs
+        except FileNotFoundError:
+            print('The filepath for soil water data is not found.')
+        else:
+            self.comment = meta['comment']
+            ts = datetime.datetime.strptime(meta['tmstmp'],
+                                            '%m/%d/%Y %H:%M:%S')
+            self.tmstmp = ts
+            self._fromdataframe(df)
+
+    def _todataframe(self):
+        """Flatten self.swdata to one DataFrame row per SWC layer."""
+
+        keys = sorted(self.swdata.keys())
+        cols = self.swpcols
+        nlyrs = [len(self.swdata[key].mvswc) for key in keys]
+        dpths = np.empty(sum(nlyrs), dtype=np.int64) #cm
+        swc = np.empty(sum(nlyrs), dtype=np.float64) #cm3/cm3
+        prof = np.empty((len(keys), len(cols)), dtype=np.float64)
+        i = 0
+        for j, key in enumerate(keys):
+            swp = self.swdata[key]
+            n = nlyrs[j]
+            dpths[i:i+n] = sorted(swp.mvswc.keys())
+            swc[i:i+n] = [swp.mvswc[dpth] for dpth in dpths[i:i+n]]
+            prof[j] = [getattr(swp,col) for col in cols]
+            i += n
+        data = {'Year-DOY':np.repeat(np.array(keys, dtype=str), nlyrs),
+                'Depth':dpths,
+                'SWC':swc}
+        for k, col in enumerate(cols):
+            data[col] = np.repeat(prof[:,k], nlyrs)
+        return pd.DataFrame(data)
+
+    def _fromdataframe(self, df):
+        """Rebuild self.swdata from a DataFrame made by _todataframe."""
+
+        self.swdata.clear()
+        for mdate, grp in df.groupby('Year-DOY', sort=True):
+            mvswc = dict(zip(grp['Depth'].tolist(),
+                             grp['SWC'].tolist()))
+            swp = self.SoilWaterProfile(mdate,
+                                        mvswc,
+                                        par = self.par,
+                                        sol = self.sol)
+            for col in self.swpcols:
+                setattr(swp, col, float(grp[col].iloc[0]))
+            self.addprofile(mdate,swp)
+
     def addprofile(self,mdate,swp):
         """Add a SoilWaterProfile object to self.swdata
 
@@ -234,6 +386,69 @@ class SoilWaterSeries:
 
         pass
 
+    def getZr(self, mdl):
+        """Get Zr for all profiles from model simulation output
+
+        Equivalent to calling SoilWaterProfile.getZr for each profile
+        in self.swdata, but with a single lookup in mdl.odata.
+
+        Parameters
+        ----------
+        mdl : pyfao56 Model object
+            Provides a Model instance with an odata DataFrame
+        """
+
+        keys = sorted(self.swdata.keys())
+        Zr, = self._getodata(mdl, keys, ['Zr'])
+        for key, value in zip(keys, Zr.tolist()):
+            self.swdata[key].Zr = value
+
+    def computeDr(self, negdep = True):
+        """Compute root zone soil water status metrics for all profiles
+
+        Equivalent to calling SoilWaterProfile.computeDr for each
+        profile in self.swdata, but soil layer data is extracted to
+        arrays once and shared among profiles.
+
+        Parameters
+        ----------
+        negdep : boolean, optional
+            Allow negative depletion or not (default = True)
+        """
+
+        soils = {}
+        for key in sorted(self.swdata.keys()):
+            swp = self.swdata[key]
+            ids = (id(swp.par), id(swp.sol))
+            if ids not in soils:
+                soils[ids] = _soil_layers(swp.par, swp.sol)
+            swp._computeDr(soils[ids], negdep)
+
+    def computeKs(self, mdl):
+        """Estimate Ks for all profiles from measured Dr, TAW, and RAW
+
+        Equivalent to calling SoilWaterProfile.computeKs for each
+        profile in self.swdata, but computed with array operations.
+
+        Parameters
+        ----------
+        mdl : pyfao56 Model object
+            Provides a Model instance with an odata DataFrame
+        """
+
+        keys = sorted(self.swdata.keys())
+        TAW, RAW = self._getodata(mdl, keys, ['TAW','RAW'])
+        Dr = np.array([self.swdata[key].mDr for key in keys])
+        Ks = np.clip((TAW - Dr) / (TAW - RAW), 0.0, 1.0) #FAO-56 Eq. 84
+        for key, mKs in zip(keys, Ks.tolist()):
+            self.swdata[key].mKs = mKs
+
+    def _getodata(self, mdl, keys, cols):
+        """Get mdl.odata columns on the keys dates as float arrays."""
+
+        data = mdl.odata.loc[keys, cols].to_numpy(dtype=np.float64)
+        return data.T
+
     def summarize(self):
         """Summarize the series of root zone soil water metrics
 
@@ -243,18 +458,16 @@ class SoilWaterSeries:
             Summary of series of root zone soil water metrics
         """
 
-        cols = ['Year-DOY','mDr','mDrmax','mfDr','mfDrmax',
+        cols = ['mDr','mDrmax','mfDr','mfDrmax',
                 'mSWCr','mSWCrmax','mKs']
-        summary = pd.DataFrame(columns = cols)
-        summary = summary.set_index('Year-DOY')
-        for key in sorted(self.swdata.keys()):
-            summary.loc[key,'mDr'] = self.swdata[key].mDr
-            summary.loc[key,'mDrmax'] = self.swdata[key].mDrmax
-            summary.loc[key,'mfDr'] = self.swdata[key].mfDr
-            summary.loc[key,'mfDrmax'] = self.swdata[key].mfDrmax
-            summary.loc[key,'mSWCr'] = self.swdata[key].mSWCr
-            summary.loc[key,'mSWCrmax'] = self.swdata[key].mSWCrmax
-            summary.loc[key,'mKs'] = self.swdata[key].mKs
+        keys = sorted(self.swdata.keys())
+        data = {col:np.empty(len(keys), dtype=np.float64)
+                for col in cols}
+        for i, key in enumerate(keys):
+            for col in cols:
+                data[col][i] = getattr(self.swdata[key],col)
+        summary = pd.DataFrame(data, index=keys)
+        summary.index.name = 'Year-DOY'
         return summary
 
     class SoilWaterProfile:
@@ -302,6 +515,10 @@ class SoilWaterSeries:
             Estimate Ks from measured Dr, TAW, and RAW
         """
 
+        _headfmt = '{:8s} {:2d} '
+        _tailfmt = ('{:5.3f} {:8.3f} {:8.3f} {:6.3f} {:7.3f} '
+                    '{:5.3f} {:8.3f} {:6.3f}')
+
         def __init__(self, mdate, mvswc, par = None, sol = None,
                      Zr=float('NaN')):
             """
@@ -341,19 +558,15 @@ class SoilWaterSeries:
         def __str__(self):
             """Represent the SoilWaterProfile class as a string"""
 
-            s = ('{:8s} '
-                 '{:2d} '
-                ).format(self.mdate,len(self.mvswc.keys()))
-            for key in sorted(self.mvswc.keys()):
-                s += '{:3d} '.format(key)
-            for key in sorted(self.mvswc.keys()):
-                s += '{:5.3f} '.format(self.mvswc[key])
-            s += ('{:5.3f} {:8.3f} {:8.3f} {:6.3f} {:7.3f} '
-                  '{:5.3f} {:8.3f} {:6.3f}'
-                 ).format(self.Zr,self.mDr,self.mDrmax,self.mfDr,
-                          self.mfDrmax,self.mSWCr,self.mSWCrmax,
-                          self.mKs)
-            return s
+            dpths = sorted(self.mvswc.keys())
+            s = [self._headfmt.format(self.mdate,len(dpths))]
+            s += ['{:3d} '.format(key) for key in dpths]
+            s += ['{:5.3f} '.format(self.mvswc[key]) for key in dpths]
+            s += [self._tailfmt.format(self.Zr,self.mDr,self.mDrmax,
+                                       self.mfDr,self.mfDrmax,
+                                       self.mSWCr,self.mSWCrmax,
+                                       self.mKs)]
+            return ''.join(s)
 
         def getZr(self, mdl):
             """Get Zr from model simulation on the measurement date
@@ -369,67 +582,44 @@ class SoilWaterSeries:
         def computeDr(self, negdep = True):
             """Compute root zone soil water status metrics
 
+            Measurement and soil layers are evaluated in order of
+            increasing bottom depth, even if mvswc or the SoilProfile
+            index are not sorted.
+
             Parameters
             ----------
             negdep : boolean, optional
                 Allow negative depletion or not (default = True)
             """
 
+            self._computeDr(_soil_layers(self.par, self.sol), negdep)
+
+        def _computeDr(self, soil, negdep = True):
+            """Compute root zone metrics given _soil_layers() arrays"""
+
             #Root zone is evaluated in 10^-5 meter increments
             #Set root zone depth variables in 10^-5 meter units
             rzmax = int(self.par.Zrmax * 100000.) #10^-5 meters
             rz = int(self.Zr * 100000.) #10^-5 meters
 
             #Initialize other variables
-            swc_dpths = list(self.mvswc.keys())
-            if self.sol is not None:
-                sol_dpths = list(self.sol.sdata.index.values) #cm
-                thetaFC = self.sol.sdata['thetaFC'].to_dict()
-                thetaWP = self.sol.sdata['thetaWP'].to_dict()
-            elif self.par is not None:
-                sol_dpth = int(self.par.Zrmax*100.) #cm
-                sol_dpths = [sol_dpth] #cm
-                thetaFC = {sol_dpth:self.par.thetaFC}
-                thetaWP = {sol_dpth:self.par.thetaWP}
-            else:
-                raise Exception("No soil profile data available.")
-            FCr = 0.
-            FCrmax = 0.
-            WPr = 0.
-            WPrmax = 0.
-            SWCr = 0.
-            SWCrmax = 0.
-
-            #Iterate the max root zone depth in 10^-5 m increments
+            sol_dpths, thetaFC, thetaWP = soil
+            swc_dpths = np.fromiter(self.mvswc.keys(), dtype=np.int64)
+            swc = np.fromiter(self.mvswc.values(), dtype=np.float64)
             inc_dpth = 0.01 #mm
-            for inc in list(range(1, rzmax + 1)):
-                #Find soil profile layer depth that contains inc
-                sol_dpth = [dpth for (idx, dpth) in enumerate(sol_dpths)
-                            if inc <= dpth * 1000][0] #10^-5 meters
-                #Find SWC measurement bottom depth that contains inc
-                swc_dpth = [dpth for (idx, dpth) in enumerate(swc_dpths)
-                            if inc <= dpth * 1000][0] #10^-5 meters
-                #Compute incremental values
-                FCinc  = thetaFC[sol_dpth] * inc_dpth #mm
-                WPinc  = thetaWP[sol_dpth] * inc_dpth #mm
-                SWCinc = self.mvswc[swc_dpth] * inc_dpth #mm
-                if not negdep and SWCinc > FCinc:
-                    SWCinc = FCinc #no negative depletion
-
-                #Accumulate
-                FCrmax  += FCinc #mm
-                WPrmax  += WPinc #mm
-                SWCrmax += SWCinc #mm
-                if inc < rz:
-                    FCr  += FCinc #mm
-                    WPr  += WPinc #mm
-                    SWCr += SWCinc #mm
+
+            #Accumulate over the max root zone and the root zone
+            (FCr, FCrmax, WPr, WPrmax, Dr, Drmax) = _rz_accumulate(
+                sol_dpths, thetaFC, thetaWP, swc_dpths, swc, rz, rzmax,
+                negdep)
+            SWCrmax = FCrmax - Drmax #mm
+            SWCr = FCr - Dr #mm
 
             #Finalize water status metrics
-            self.mDr = FCr - SWCr #mm
-            self.mDrmax = FCrmax - SWCrmax #mm
-            self.mfDr = (FCr - SWCr) / (FCr - WPr) #mm/mm
-            self.mfDrmax = (FCrmax-SWCrmax)/(FCrmax-WPrmax) #mm/mm
+            self.mDr = Dr #mm
+            self.mDrmax = Drmax #mm
+            self.mfDr = Dr / (FCr - WPr) #mm/mm
+            self.mfDrmax = Drmax / (FCrmax - WPrmax) #mm/mm
             self.mSWCr = SWCr / (rz * inc_dpth) #cm3/cm3
             self.mSWCrmax = SWCrmax / (rzmax * inc_dpth) #cm3/cm3
 
@@ -445,4 +635,112 @@ class SoilWaterSeries:
             TAW = mdl.odata.loc[self.mdate,'TAW']
             RAW = mdl.odata.loc[self.mdate,'RAW']
             Ks = (TAW - self.mDr) / (TAW - RAW) #FAO-56 Eq. 84
-            self.mKs = sorted([0.0,Ks,1.0])[1]
+            self.mKs = 0.0 if Ks < 0.0 else (1.0 if Ks > 1.0 else Ks)
+
+def _soil_layers(par, sol):
+    """Get soil layer data as contiguous arrays for _rz_accumulate.
+
+    Parameters
+    ----------
+    par : pyfao56 Parameters object
+        Provides the parameter data (e.g., thetaFC, Zrmax)
+    sol : pyfao56 SoilProfile object
+        Provides layered soil profile data (e.g., thetaFC)
+
+    Returns
+    -------
+    tuple
+        (sol_dpths, thetaFC, thetaWP) as int64 (cm) and float64
+        (cm3/cm3) arrays, from sol if available, otherwise from par
+    """
+
+    if sol is not None:
+        sol_dpths = sol.sdata.index.to_numpy(dtype=np.int64) #cm
+        thetaFC = sol.sdata['thetaFC'].to_numpy(dtype=np.float64)
+        thetaWP = sol.sdata['thetaWP'].to_numpy(dtype=np.float64)
+    elif par is not None:
+        sol_dpths = np.array([int(par.Zrmax*100.)], dtype=np.int64)
+        thetaFC = np.array([par.thetaFC], dtype=np.float64)
+        thetaWP = np.array([par.thetaWP], dtype=np.float64)
+    else:
+        raise Exception("No soil profile data available.")
+    return sol_dpths, thetaFC, thetaWP
+
+def _rz_accumulate(sol_dpths, thetaFC, thetaWP, swc_dpths, swc, rz,
+                   rzmax, negdep=True):
+    """Accumulate soil water over the root zone in 10^-5 m increments.
+
+    The max root zone is split into segments of increments that fall
+    within one soil layer, one SWC measurement layer, and either inside
+    (increment < rz) or outside of the root zone. Each segment is then
+    weighted by its number of increments, which gives the same sums as
+    iterating over every increment.
+
+    Layers are sorted by bottom depth, so each increment is assigned to
+    the shallowest layer whose bottom is at or below it, regardless of
+    the order of the inputs. The former per-increment loop took the
+    first matching layer in the given dict/index order instead, so
+    results differ from it if mvswc keys or the SoilProfile index are
+    not in increasing depth order. For sorted depths they agree.
+
+    Parameters
+    ----------
+    sol_dpths : array_like
+        Bottom depths of soil profile layers (cm)
+    thetaFC : array_like
+        Field capacity for each soil profile layer (cm3/cm3)
+    thetaWP : array_like
+        Wilting point for each soil profile layer (cm3/cm3)
+    swc_dpths : array_like
+        Bottom depths of SWC measurement layers (cm)
+    swc : array_like
+        Measured SWC for each measurement layer (cm3/cm3)
+    rz : int
+        Root zone depth (10^-5 m)
+    rzmax : int
+        Maximum root zone depth (10^-5 m)
+    negdep : boolean, optional
+        Allow negative depletion or not (default = True)
+
+    Returns
+    -------
+    tuple
+        (FCr, FCrmax, WPr, WPrmax, Dr, Drmax) in mm, as Python floats
+        so that a zero-depth root zone raises ZeroDivisionError in
+        computeDr, as in per-increment iteration
+    """
+
+    inc_dpth = 0.01 #mm
+
+    #Sort layers by bottom depth in 10^-5 meter units
+    sol_bots = np.asarray(sol_dpths, dtype=np.int64) * 1000
+    sol_ord = np.argsort(sol_bots, kind='stable')
+    sol_bots = sol_bots[sol_ord]
+    swc_bots = np.asarray(swc_dpths, dtype=np.int64) * 1000
+    swc_ord = np.argsort(swc_bots, kind='stable')
+    swc_bots = swc_bots[swc_ord]
+
+    #Set segment bounds at layer bottoms and the root zone depth
+    bnds = np.concatenate((sol_bots, swc_bots,
+                           [0, min(max(rz - 1, 0), rzmax), rzmax]))
+    bnds = np.unique(bnds[bnds <= rzmax].astype(np.int64))
+    ninc = np.diff(bnds) #number of increments in each segment
+    lastinc = bnds[1:] #deepest increment in each segment
+
+    #Find layers that contain each segment (first bottom >= lastinc)
+    sol_idx = sol_ord[np.searchsorted(sol_bots, lastinc, side='left')]
+    swc_idx = swc_ord[np.searchsorted(swc_bots, lastinc, side='left')]
+
+    #Compute incremental values for each segment
+    FCinc = np.asarray(thetaFC, dtype=np.float64)[sol_idx]*inc_dpth #mm
+    WPinc = np.asarray(thetaWP, dtype=np.float64)[sol_idx]*inc_dpth #mm
+    SWCinc = np.asarray(swc, dtype=np.float64)[swc_idx]*inc_dpth #mm
+    Drinc = FCinc - SWCinc #mm
+    if not negdep:
+        Drinc = np.maximum(Drinc, 0.0) #no negative depletion
+
+    #Weight segments by increments in max root zone and root zone
+    wts = np.array([ninc, np.where(lastinc < rz, ninc, 0)]).T
+    sums = np.array([FCinc, WPinc, Drinc]) @ wts #mm
+    (FCrmax, FCr), (WPrmax, WPr), (Drmax, Dr) = sums.tolist()
+    return FCr, FCrmax, WPr, WPrmax, Dr, Drmax
@@ -30,6 +30,8 @@ class Statistics:
 
     Attributes
     ----------
+    keys : list
+        Names of the goodness-of-fit statistics in output order
     simulated : numpy array
         A 1d array of simulated data
     measured : numpy array
@@ -42,10 +44,15 @@ class Statistics:
 
     Methods
     -------
+    compute(simulated,measured)
+        Compute goodness-of-fit statistics without a class instance
     savefile(filepath='pyfao56.fit')
         Save goodness-of-fit statistics to a file
     """
 
+    keys = ['bias','rbias','pbias','maxerr','meanerr','mae','sse',
+            'r','r2','rmse','rrmse','prmse','crm','nse','d']
+
     def __init__(self, simulated, measured, comment=''):
         """Initialize the Statistics class attributes.
 
@@ -58,26 +65,68 @@ class Statistics:
         """
 
         self.comment = 'Comments: ' + comment.strip()
-        self.simulated = np.array(simulated).flatten()
-        self.measured = np.array(measured).flatten()
-        s = self.simulated
-        m = self.measured
-        self.stats = {}
-        self.stats.update({'bias'   :self._bias(s,m)})
-        self.stats.update({'rbias'  :self._rbias(s,m)})
-        self.stats.update({'pbias'  :self._pbias(s,m)})
-        self.stats.update({'maxerr' :self._maxerr(s,m)})
-        self.stats.update({'meanerr':self._meanerr(s,m)})
-        self.stats.update({'mae'    :self._mae(s,m)})
-        self.stats.update({'sse'    :self._sse(s,m)})
-        self.stats.update({'r'      :self._r(s,m)})
-        self.stats.update({'r2'     :self._r2(s,m)})
-        self.stats.update({'rmse'   :self._rmse(s,m)})
-        self.stats.update({'rrmse'  :self._rrmse(s,m)})
-        self.stats.update({'prmse'  :self._prmse(s,m)})
-        self.stats.update({'crm'    :self._crm(s,m)})
-        self.stats.update({'nse'    :self._nse(s,m)})
-        self.stats.update({'d'      :self._d(s,m)})
+        self.simulated = np.asarray(simulated, dtype=np.float64).ravel()
+        self.measured = np.asarray(measured, dtype=np.float64).ravel()
+        self.stats = self.compute(self.simulated, self.measured)
+
+    @classmethod
+    def compute(cls, simulated, measured):
+        """Compute goodness-of-fit statistics without a class instance.
+
+        Parameters
+        ----------
+        simulated : list
+            A list of simulated data
+        measured : list
+            A list of measured data
+
+        Returns
+        -------
+        stats : dict
+            Goodness-of-fit statistics, same as the stats attribute
+        """
+
+        s = np.asarray(simulated, dtype=np.float64).ravel()
+        m = np.asarray(measured, dtype=np.float64).ravel()
+        #Intermediate values shared among the statistics
+        n = s.size
+        err = s-m
+        abserr = np.absolute(err)
+        maxerr = cls._maxerr(abserr)
+
+        #For identical inputs (maxerr is zero), statistics with a zero
+        #denominator, e.g. r for constant data, are undefined (NaN)
+        quiet = {}
+        if maxerr == 0.0:
+            quiet = {'divide':'ignore','invalid':'ignore'}
+        with np.errstate(**quiet):
+            msum = np.sum(m)
+            mbar = msum/n
+            mdev = m-mbar
+            bias = cls._bias(err)
+            sse = cls._sse(err)
+            rbias = cls._rbias(bias,mbar)
+            rmse = cls._rmse(sse,n)
+            rrmse = cls._rrmse(rmse,mbar)
+            r = cls._r(s,mdev)
+
+            stats = {}
+            stats.update({'bias'   :bias})
+            stats.update({'rbias'  :rbias})
+            stats.update({'pbias'  :cls._pbias(rbias)})
+            stats.update({'maxerr' :maxerr})
+            stats.update({'meanerr':cls._meanerr(bias,n)})
+            stats.update({'mae'    :cls._mae(abserr)})
+            stats.update({'sse'    :sse})
+            stats.update({'r'      :r})
+            stats.update({'r2'     :cls._r2(r)})
+            stats.update({'rmse'   :rmse})
+            stats.update({'rrmse'  :rrmse})
+            stats.update({'prmse'  :cls._prmse(rrmse)})
+            stats.update({'crm'    :cls._crm(s,msum)})
+            stats.update({'nse'    :cls._nse(sse,mdev)})
+            stats.update({'d'      :cls._d(sse,s,mdev,mbar)})
+        return stats
 
     def __str__(self):
         """Represent the Statistics class variables as a string."""
@@ -97,9 +146,7 @@ class Statistics:
                       ast,
                       self.comment,
                       ast)
-        keys = ['bias','rbias','pbias','maxerr','meanerr','mae','sse',
-                'r','r2','rmse','rrmse','prmse','crm','nse','d']
-        for key in keys:
+        for key in self.keys:
             s += '{:s} : {:f}\n'.format(key, self.stats[key])
         return s
 
@@ -125,75 +172,86 @@ class Statistics:
             f.write(self.__str__())
             f.close()
 
-    def _bias(self,s,m):
-        """Compute the bias."""
-        return np.sum(s-m)
+    @staticmethod
+    def _bias(err):
+        """Compute the bias from the errors (s-m)."""
+        return np.sum(err)
 
-    def _rbias(self,s,m):
-        """Compute the relative bias."""
-        return np.sum(s-m)/np.mean(m)
+    @staticmethod
+    def _rbias(bias,mbar):
+        """Compute the relative bias from bias and mean(m)."""
+        return bias/mbar
 
-    def _pbias(self,s,m):
-        """Compute the percent bias."""
-        return np.sum(s-m)/np.mean(m)*100.
+    @staticmethod
+    def _pbias(rbias):
+        """Compute the percent bias from the relative bias."""
+        return rbias*100.
 
-    def _maxerr(self,s,m):
-        """Compute maximum error."""
-        return np.max(np.absolute(s-m))
+    @staticmethod
+    def _maxerr(abserr):
+        """Compute maximum error from the absolute errors."""
+        return np.max(abserr)
 
-    def _meanerr(self,s,m):
-        """Compute the mean error."""
-        return np.mean(s-m)
+    @staticmethod
+    def _meanerr(bias,n):
+        """Compute the mean error from bias and the number of data."""
+        return bias/n
 
-    def _mae(self,s,m):
-        """Compute the mean absolute error."""
-        return np.mean(np.absolute(s-m))
+    @staticmethod
+    def _mae(abserr):
+        """Compute the mean absolute error from the absolute errors."""
+        return np.mean(abserr)
 
-    def _sse(self,s,m):
-        """Compute the sum of squared error."""
-        return np.sum(np.square(s-m))
+    @staticmethod
+    def _sse(err):
+        """Compute the sum of squared error from the errors (s-m)."""
+        return np.sum(np.square(err))
 
-    def _r(self,s,m):
+    @staticmethod
+    def _r(s,mdev):
         """Compute the Pearson correlation coefficient (r)."""
-        a = np.sum((s-np.mean(s))*(m-np.mean(m)))
-        b = np.sum(np.square(s-np.mean(s)))
-        c = np.sum(np.square(m-np.mean(m)))
+        sdev = s-np.mean(s)
+        a = np.dot(sdev,mdev)
+        b = np.dot(sdev,sdev)
+        c = np.dot(mdev,mdev)
         return a/np.sqrt(b*c)
         #return np.corrcoef(s,m)[0][1]
 
-    def _r2(self,s,m):
-        """Compute the coefficient of determination (r^2)."""
-        a = np.sum((s-np.mean(s))*(m-np.mean(m)))
-        b = np.sum(np.square(s-np.mean(s)))
-        c = np.sum(np.square(m-np.mean(m)))
-        return (a/np.sqrt(b*c))**2.0
+    @staticmethod
+    def _r2(r):
+        """Compute the coefficient of determination (r^2) from r."""
+        return r**2.0
 
-    def _rmse(self,s,m):
-        """Compute the root mean squared error."""
-        return np.sqrt(np.mean(np.square(s-m)))
+    @staticmethod
+    def _rmse(sse,n):
+        """Compute the root mean squared error from sse."""
+        return np.sqrt(sse/n)
 
-    def _rrmse(self,s,m):
-        """Compute the relative root mean squared error."""
-        return np.sqrt(np.mean(np.square(s-m)))/np.mean(m)
+    @staticmethod
+    def _rrmse(rmse,mbar):
+        """Compute the relative root mean squared error from rmse."""
+        return rmse/mbar
 
-    def _prmse(self,s,m):
-        """Compute the percent root mean squared error."""
-        return np.sqrt(np.mean(np.square(s-m)))/np.mean(m)*100.
+    @staticmethod
+    def _prmse(rrmse):
+        """Compute the percent root mean squared error from rrmse."""
+        return rrmse*100.
 
-    def _crm(self,s,m):
+    @staticmethod
+    def _crm(s,msum):
         """Compute the coefficient of residual mass."""
-        return (np.sum(s)-np.sum(m))/np.sum(m)
+        return (np.sum(s)-msum)/msum
 
-    def _nse(self,s,m):
+    @staticmethod
+    def _nse(sse,mdev):
         """Compute the Nash & Sutcliffe (1970) model efficiency."""
-        a = np.sum(np.square(s-m))
-        b = np.sum(np.square(m-np.mean(m)))
-        return 1.0-a/b
+        b = np.sum(np.square(mdev))
+        return 1.0-sse/b
 
-    def _d(self,s,m):
+    @staticmethod
+    def _d(sse,s,mdev,mbar):
         """Compute the Willmott (1981) index of agreement (d)."""
-        a = np.sum(np.square(s-m))
-        b = np.absolute(s-np.mean(m))
-        c = np.absolute(m-np.mean(m))
+        b = np.absolute(s-mbar)
+        c = np.absolute(mdev)
         d = np.sum(np.square(b+c))
-        return 1.0-a/d
+        return 1.0-sse/d
@@ -118,6 +118,16 @@ def run():
         sws.swdata[key].computeKs(mdl)
     sws.savefile(os.path.join(module_dir,'cotton2022p10-2.sws'))
 
+    #Series-level methods must match the per-profile computations
+    sws2 = tools.SoilWaterSeries(filepath='./cotton2022p10-2.sws',
+                                 par=par,sol=sol)
+    sws2.getZr(mdl)
+    sws2.computeDr()
+    sws2.computeKs(mdl)
+    assert sws2.summarize().equals(sws.summarize())
+    for key in sws.swdata.keys():
+        assert sws2.swdata[key].Zr == sws.swdata[key].Zr
+
     #Compute fit statistics
     sDr = []
     mDr = []
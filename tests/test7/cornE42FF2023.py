@@ -16,6 +16,8 @@ The cornE42FF2023.py module contains the following:
 import pyfao56 as fao
 import pyfao56.tools as tools
 import os
+import importlib.util
+import tempfile
 import numpy as np
 
 def run():
@@ -64,6 +66,31 @@ def run():
         sws.swdata[key].computeKs(mdl)
     sws.savefile(os.path.join(module_dir,'E42FF2023.sws'))
 
+    #Round trip soil water data through each binary file format
+    #Skip formats whose optional backend package is not installed
+    backends = {'feather':'pyarrow','parquet':'pyarrow','hdf':'tables'}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for fmt in sws.binfmts:
+            if importlib.util.find_spec(backends[fmt]) is None:
+                print('Skipping {:s} round trip, {:s} is not installed'
+                      .format(fmt, backends[fmt]))
+                continue
+            binpath = os.path.join(tmpdir, 'E42FF2023.' + fmt)
+            sws.savebinary(binpath, fmt=fmt)
+            sws2 = tools.SoilWaterSeries(par=par, sol=sol)
+            sws2.loadbinary(binpath, fmt=fmt)
+            assert sws2.summarize().equals(sws.summarize())
+            assert sws2.comment == sws.comment
+            assert sws2.tmstmp == sws.tmstmp.replace(microsecond=0)
+            for key in sws.swdata.keys():
+                assert sws2.swdata[key].mvswc == sws.swdata[key].mvswc
+                assert sws2.swdata[key].Zr == sws.swdata[key].Zr
+            #An empty series must also round trip
+            empty = tools.SoilWaterSeries()
+            empty.savebinary(binpath, fmt=fmt)
+            sws2.loadbinary(binpath, fmt=fmt)
+            assert len(sws2.swdata) == 0
+
     #Plot simulated data alone
     #vis = tools.Visualization(mdl, dayline=True)
     #pngpath = os.path.join(module_dir, 'E42FF2023_Dr.png')